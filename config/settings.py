@@ -13,6 +13,8 @@ load_dotenv()
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 if not OPENAI_API_KEY:
     raise ValueError("OPENAI_API_KEY must be set in environment variables")
+# Multiplex concurrent OpenAI calls over one HTTP/2 connection (needs httpx[http2])
+OPENAI_HTTP2 = os.getenv("OPENAI_HTTP2", "false").lower() == "true"
 
 # Logging Configuration
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
@@ -147,6 +149,7 @@ PANEL_DEBUG_LOG_DIR = os.getenv(
 def get_all_settings() -> Dict[str, Any]:
     return {
         "OPENAI_API_KEY": "***REDACTED***" if OPENAI_API_KEY else None,
+        "OPENAI_HTTP2": OPENAI_HTTP2,
         "LOG_LEVEL": LOG_LEVEL,
         "BATCH_SIZE": BATCH_SIZE,
         "API_RATE_LIMIT": API_RATE_LIMIT,
@@ -5,14 +5,31 @@ import logging
 import time
 from pathlib import Path
 
-from openai import AsyncOpenAI
-from config.settings import OPENAI_API_KEY, get_all_settings
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+from config.settings import OPENAI_API_KEY, OPENAI_HTTP2, get_all_settings
 from utils.logging_utils import setup_logging
 from processing.job_processor import process_job_site_async
 from utils.performance_utils import get_tracker
 from templates.prompt_registry import verify_registry
 
 
+def create_http_client():
+    """
+    Return an HTTP/2 client for the shared OpenAI client when OPENAI_HTTP2 is
+    enabled, so concurrent extraction, AI and OCR requests share one
+    connection. Returns None (SDK default HTTP/1.1 pool) when disabled or
+    when h2 is not installed.
+    """
+    if not OPENAI_HTTP2:
+        return None
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        logging.warning("OPENAI_HTTP2 is enabled but the h2 package is not installed; using HTTP/1.1")
+        return None
+    return DefaultAsyncHttpxClient(http2=True)
+
+
 async def main_async():
     """
     Main async function to handle processing with better error handling.
@@ -75,7 +92,7 @@ async def main_async():
             logging.warning("Prompt registry may not be fully populated!")
 
         # 2) Create OpenAI Client (v1.66.3)
-        client = AsyncOpenAI(api_key=OPENAI_API_KEY)
+        client = AsyncOpenAI(api_key=OPENAI_API_KEY, http_client=create_http_client())
         try:
             # 3) Record start time
             start_time = time.time()
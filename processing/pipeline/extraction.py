@@ -100,7 +100,8 @@ async def step_extract_content(
         or "panel" in drawing_type
         or "panel" in (state.get("subtype") or "").lower()
     )
-    if FORCE_PANEL_OCR and OCR_ENABLED and is_panel_schedule_doc:
+    force_panel_ocr = FORCE_PANEL_OCR and OCR_ENABLED and is_panel_schedule_doc
+    if force_panel_ocr:
         if not should_ocr:
             logger.info(
                 "FORCE_PANEL_OCR enabled – overriding OCR decision for panel schedule document"
@@ -148,6 +149,8 @@ async def step_extract_content(
                 page_count=page_count,
                 assume_ocr_needed=should_ocr,
                 drawing_type=processing_drawing_type,
+                # Forced panel OCR must cover text-rich pages too
+                skip_text_rich_pages=not force_panel_ocr,
             )
             if isinstance(ocr_payload, OCRRunResult):
                 ocr_text = ocr_payload.text
@@ -8,6 +8,7 @@ understand panel schedule structure.
 """
 import re
 import logging
+from functools import lru_cache
 from typing import List, Dict, Any, Optional, Tuple
 from collections import Counter
 
@@ -23,6 +24,9 @@ CIRCUIT_HEADER_KEYWORDS = {
     "poles": ["poles", "pole", "p"],
     "phase": ["phase", "ph", "a", "b", "c"],
 }
+# Line classifiers are pure and run on the same lines by several stages
+# (noise stripping, circuits-per-line sampling, circuit counting)
+LINE_CACHE_SIZE = 4096
 
 
 def split_into_panels(lines: List[str]) -> List[Dict[str, Any]]:
@@ -123,6 +127,7 @@ def classify_line(line: str) -> str:
     return "other"
 
 
+@lru_cache(maxsize=LINE_CACHE_SIZE)
 def is_circuit_row(line: str) -> bool:
     """
     Determine if a line represents a circuit row.
@@ -143,6 +148,10 @@ def is_circuit_row(line: str) -> bool:
     if any(keyword in line_lower for keyword in SUMMARY_KEYWORDS):
         return False
     
+    # Cheap prefilter: AMP_RE needs an "A", so skip the regex when none exists
+    if "a" not in line_lower:
+        return False
+    
     has_amps = bool(AMP_RE.search(line))
     has_load = bool(LOAD_RE.search(line))
     
@@ -155,6 +164,7 @@ def is_circuit_row(line: str) -> bool:
     return False
 
 
+@lru_cache(maxsize=LINE_CACHE_SIZE)
 def is_summary_line(line: str) -> bool:
     """
     Determine if a line represents a summary/totals line.
@@ -167,10 +177,10 @@ def is_summary_line(line: str) -> bool:
     """
     line_lower = line.lower()
     
-    has_summary_keyword = any(keyword in line_lower for keyword in SUMMARY_KEYWORDS)
-    has_load_or_amp = bool(LOAD_RE.search(line) or AMP_RE.search(line))
+    if not any(keyword in line_lower for keyword in SUMMARY_KEYWORDS):
+        return False
     
-    return has_summary_keyword and has_load_or_amp
+    return bool(LOAD_RE.search(line) or AMP_RE.search(line))
 
 
 def detect_circuits_per_line(panel_lines: List[str]) -> int:
@@ -2,6 +2,7 @@
 Mechanical drawing extractor.
 """
 import logging
+from operator import itemgetter
 from typing import List, Dict, Any, Optional
 
 from .base import PyMuPdfExtractor
@@ -11,6 +12,10 @@ from .models import ExtractionResult
 class MechanicalExtractor(PyMuPdfExtractor):
     """Specialized extractor for mechanical drawings."""
 
+    # Pages with less text than this (e.g. legend sheets) cannot hold a
+    # meaningful schedule, so enhancement is skipped when no tables exist
+    _MIN_ENHANCE_CHARS = 256
+
     def __init__(self, logger: Optional[logging.Logger] = None):
         super().__init__(logger)
 
@@ -29,6 +34,13 @@ class MechanicalExtractor(PyMuPdfExtractor):
             )
             return result
 
+        if len(result.raw_text) < self._MIN_ENHANCE_CHARS and not result.tables:
+            self.logger.debug(
+                f"Skipping mechanical enhancement for {file_path}: text below "
+                f"{self._MIN_ENHANCE_CHARS} chars and no tables."
+            )
+            return result
+
         # Enhance extraction with mechanical-specific processing
         try:
             # Focus on equipment schedules
@@ -59,20 +71,20 @@ class MechanicalExtractor(PyMuPdfExtractor):
             text = "EQUIPMENT INFORMATION DETECTED:\n" + text
         return text
 
+    def _mechanical_table_priority(self, content: str) -> int:
+        """Rank lowercased table content: equipment schedules first."""
+        # Simple heuristic - look for equipment-related terms
+        if any(term in content for term in ("equipment", "hvac", "cfm", "tonnage")):
+            return 0
+        return 1
+
     def _prioritize_mechanical_tables(
         self, tables: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
         """Prioritize mechanical tables - equipment schedules first."""
-        # Simple heuristic - look for equipment-related terms
-        equipment_tables = []
-        other_tables = []
-
-        for table in tables:
-            content = table.get("content", "").lower()
-            if any(term in content for term in ["equipment", "hvac", "cfm", "tonnage"]):
-                equipment_tables.append(table)
-            else:
-                other_tables.append(table)
-
-        return equipment_tables + other_tables
-
+        scored = [
+            (self._mechanical_table_priority(table.get("content", "").lower()), table)
+            for table in tables
+        ]
+        scored.sort(key=itemgetter(0))
+        return [table for _, table in scored]
@@ -2,6 +2,7 @@
 Plumbing drawing extractor.
 """
 import logging
+from operator import itemgetter
 from typing import List, Dict, Any, Optional
 
 from .base import PyMuPdfExtractor
@@ -11,6 +12,10 @@ from .models import ExtractionResult
 class PlumbingExtractor(PyMuPdfExtractor):
     """Specialized extractor for plumbing drawings."""
 
+    # Short pages (legends, cover notes) without tables have no fixture or
+    # piping schedule worth marking up
+    _MIN_ENHANCE_CHARS = 256
+
     def __init__(self, logger: Optional[logging.Logger] = None):
         super().__init__(logger)
 
@@ -29,6 +34,13 @@ class PlumbingExtractor(PyMuPdfExtractor):
             )
             return result
 
+        if len(result.raw_text) < self._MIN_ENHANCE_CHARS and not result.tables:
+            self.logger.debug(
+                f"Skipping plumbing enhancement for {file_path}: text below "
+                f"{self._MIN_ENHANCE_CHARS} chars and no tables."
+            )
+            return result
+
         # Enhance extraction with plumbing-specific processing
         try:
             # Add simple type marker - this is where most performance gains come from
@@ -71,34 +83,26 @@ class PlumbingExtractor(PyMuPdfExtractor):
 
         return enhanced_text
 
+    def _plumbing_table_priority(self, content: str) -> int:
+        """Rank lowercased table content: fixtures, equipment, piping, other."""
+        if any(term in content for term in ("fixture", "wc", "lav", "sink", "urinal")):
+            return 0
+        if any(
+            term in content for term in ("water heater", "pump", "water temperature")
+        ):
+            return 1
+        if any(term in content for term in ("pipe", "valve", "fitting")):
+            return 2
+        return 3
+
     def _prioritize_plumbing_tables(
         self, tables: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
         """Prioritize plumbing tables - fixture schedules first."""
-        # Focus on just a few critical keywords for scoring tables
-        fixture_tables = []
-        equipment_tables = []
-        pipe_tables = []
-        other_tables = []
-
-        for table in tables:
-            content = table.get("content", "").lower()
-
-            # Check for just the most important keywords
-            if any(
-                term in content for term in ["fixture", "wc", "lav", "sink", "urinal"]
-            ):
-                fixture_tables.append(table)
-            elif any(
-                term in content
-                for term in ["water heater", "pump", "water temperature"]
-            ):
-                equipment_tables.append(table)
-            elif any(term in content for term in ["pipe", "valve", "fitting"]):
-                pipe_tables.append(table)
-            else:
-                other_tables.append(table)
-
-        # Return prioritized tables - most important first
-        return fixture_tables + equipment_tables + pipe_tables + other_tables
-
+        scored = [
+            (self._plumbing_table_priority(table.get("content", "").lower()), table)
+            for table in tables
+        ]
+        # list.sort is stable, so tables of equal priority keep their order
+        scored.sort(key=itemgetter(0))
+        return [table for _, table in scored]
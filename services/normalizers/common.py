@@ -1,12 +1,61 @@
 """
 Common normalization utilities shared across domain modules.
 """
+import math
 import re
-from typing import Any, Optional
+import sys
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Tuple
+
+_INT_RE = re.compile(r"-?\d+")
+_NUMERIC_STRIP_RE = re.compile(r"[^\d.]")
+# ASCII-only equivalent of _NUMERIC_STRIP_RE for str.translate; non-ASCII
+# input still goes through the regex so Unicode digits are handled the same
+_ASCII_NON_NUMERIC = str.maketrans(
+    "", "", "".join(chr(c) for c in range(128) if not (chr(c).isdigit() or c == 46))
+)
+
+# Synonym groups shared by several schedule types
+ID_SYNONYMS = frozenset({"id", "mark", "tag"})
+COMMENT_SYNONYMS = frozenset(
+    {"comments", "comment", "notes", "note", "remark", "remarks"}
+)
+
+# Distinct key layouts remembered per make_key_remapper lookup
+KEY_PLAN_CACHE_SIZE = 1024
+
+# Distinct unit-bearing strings ("1.5 GPM", "40 gal") whose parsed value is
+# kept; schedules repeat the same few across rows
+NUMERIC_CACHE_SIZE = 4096
 
 
 def safe_int(value: Any) -> Optional[int]:
     """Convert various value types to int if possible."""
+    # Exact-type checks first: plain ints and strings are the common inputs
+    value_type = type(value)
+    if value_type is int:
+        return value
+    if value_type is str:
+        stripped = value.strip()
+        if not stripped:
+            return None
+        # Clean integers ("12", "-3") parse directly; int() also accepts
+        # digit-group underscores the regex would stop at, so skip those
+        if "_" not in stripped:
+            try:
+                return int(stripped)
+            except ValueError:
+                pass
+        match = _INT_RE.search(stripped)
+        if match:
+            try:
+                return int(match.group(0))
+            except ValueError:
+                return None
+        return None
+    if value_type is float:
+        return int(value) if math.isfinite(value) else None
+
     if value is None:
         return None
     if isinstance(value, bool):
@@ -17,25 +66,105 @@ def safe_int(value: Any) -> Optional[int]:
         except Exception:
             return None
     if isinstance(value, str):
-        stripped = value.strip()
-        if not stripped:
-            return None
-        match = re.search(r"-?\d+", stripped)
+        match = _INT_RE.search(value.strip())
         if match:
             try:
                 return int(match.group(0))
-            except Exception:
+            except ValueError:
                 return None
     return None
 
 
+def invert_synonyms(synonyms: Mapping[str, Iterable[str]]) -> Dict[str, str]:
+    """
+    Build a lower-cased synonym -> preferred key lookup from a synonym map.
+    Keys and targets are interned so they share storage with other interned
+    copies of the same names.
+    """
+    return {
+        sys.intern(synonym.lower()): sys.intern(target)
+        for target, synonym_group in synonyms.items()
+        for synonym in synonym_group
+    }
+
+
+def make_key_remapper(
+    inverse: Mapping[str, str],
+) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Return a function that builds a new dict with synonym keys renamed via an
+    invert_synonyms lookup. A value found under a synonym takes precedence
+    over one already stored under the preferred key; among several synonyms
+    the last one wins.
+
+    Entries that only use preferred keys are copied as-is. Otherwise the
+    rename plan depends only on the entry's keys, so it is cached per key
+    layout; schedule rows almost always share one.
+    """
+
+    @lru_cache(maxsize=KEY_PLAN_CACHE_SIZE)
+    def plan(keys: Tuple[str, ...]) -> Tuple[Tuple[str, str], ...]:
+        sources: Dict[str, str] = {}
+        renamed = set()
+        for key in keys:
+            target_key = inverse.get(key) or inverse.get(key.lower())
+            if target_key and target_key != key:
+                sources[target_key] = key
+                renamed.add(target_key)
+            elif key not in renamed:
+                sources[key] = key
+        return tuple(sources.items())
+
+    canonical = frozenset(inverse.values())
+
+    def remap(data: Dict[str, Any]) -> Dict[str, Any]:
+        # Entries from extractors that already emit preferred keys need no
+        # renaming at all
+        if data.keys() <= canonical:
+            return dict(data)
+        return {target: data[source] for target, source in plan(tuple(data))}
+
+    return remap
+
+
+def first_value(data: Dict[str, Any], *keys: str) -> Any:
+    """
+    Return the first truthy value among keys, like chaining
+    data.get(k1) or data.get(k2) ...; falls back to the last key's value.
+    """
+    value = None
+    for value in map(data.get, keys):
+        if value:
+            return value
+    return value
+
+
+def strip_non_numeric(value: str) -> str:
+    """Drop every character except digits and decimal points."""
+    if value.isascii():
+        return value.translate(_ASCII_NON_NUMERIC)
+    return _NUMERIC_STRIP_RE.sub("", value)
+
+
 def extract_numeric_value(value_str: str) -> float:
     """Extract numeric value from a string, handling common units."""
     if not isinstance(value_str, str):
         return value_str
 
+    # Already a plain number ("42", "3.5"): nothing to strip. Signs,
+    # exponents and "inf"/"nan" are left to the stripping path so they are
+    # treated exactly as before.
+    if value_str.replace(".", "", 1).isdecimal():
+        return float(value_str)
+
+    return _parse_numeric_string(value_str)
+
+
+@lru_cache(maxsize=NUMERIC_CACHE_SIZE)
+def _parse_numeric_string(value_str: str) -> Any:
+    """Strip units from value_str and parse it, or return it unchanged."""
     # Remove non-numeric characters except decimals
-    numeric_chars = re.sub(r"[^\d.]", "", value_str)
+    numeric_chars = strip_non_numeric(value_str)
 
     # Return as float if possible
     try:
@@ -2,34 +2,65 @@
 Electrical normalization utilities.
 Handles panel schedules, circuits, and electrical system data.
 """
-import re
 import logging
-from typing import Dict, Any, Optional, List
+import sys
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Tuple, FrozenSet, Callable, Iterable
 
-from .common import safe_int
+from .common import safe_int, first_value, strip_non_numeric
 
 logger = logging.getLogger(__name__)
 
+# Distinct circuit key layouts whose rename plans are kept; schedules
+# typically repeat a handful of header shapes across every row
+PLAN_CACHE_SIZE = 256
+
+# Distinct VA strings whose parsed value is kept; loads such as "180 VA"
+# and blank/spare entries recur throughout a schedule
+VA_CACHE_SIZE = 4096
+
+# Keys checked, in order, when locating a circuit number
+_CIRCUIT_KEYS = (
+    "circuit_number",
+    "circuit",
+    "ckt",
+    "circuit_no",
+    "no",
+    "#",
+    "number",
+    "branch",
+    "cct",
+    "cct_no",
+)
+
+# Sort key given to circuits without a usable number
+_UNNUMBERED_SORT_KEY = 10**9
+
+# Keys marking the explicit left/right row structure in ELECTRICAL.panels
+_LEFT_RIGHT_KEYS = frozenset(("left", "right"))
+
+# Flat (non phase_loads) keys that normalize_phase_loads reads
+_FLAT_PHASE_KEYS = frozenset(("A", "B", "C", "va_phase_a", "va_phase_b", "va_phase_c"))
+
+# Side fields that make a right_side/paired circuit worth keeping
+_SIDE_VALUE_KEYS = (
+    "circuit_number",
+    "load_name",
+    "load_classification",
+    "trip",
+    "poles",
+)
+
 
 def extract_panel_circuit_number(data: Dict[str, Any]) -> Optional[int]:
     """Locate a circuit number from common key variations."""
     if not isinstance(data, dict):
         return None
-    circuit_keys = [
-        "circuit_number",
-        "circuit",
-        "ckt",
-        "circuit_no",
-        "no",
-        "#",
-        "number",
-        "branch",
-        "cct",
-        "cct_no",
-    ]
-    for key in circuit_keys:
-        if key in data:
-            num = safe_int(data.get(key))
+    # One lookup per candidate; absent keys come back as None, which
+    # safe_int would reject anyway
+    for value in map(data.get, _CIRCUIT_KEYS):
+        if value is not None:
+            num = safe_int(value)
             if num is not None:
                 return num
     return None
@@ -42,16 +73,21 @@ def normalize_phase_loads(data: Dict[str, Any]) -> Dict[str, Any]:
 
     phase_loads = data.get("phase_loads")
     if isinstance(phase_loads, dict):
+        # Always a new dict, so later writes never reach the caller's data
         return {
             "A": phase_loads.get("A"),
             "B": phase_loads.get("B"),
             "C": phase_loads.get("C"),
         }
 
+    # Most rows carry no flat phase columns; skip the six lookups for them
+    if data.keys().isdisjoint(_FLAT_PHASE_KEYS):
+        return {"A": None, "B": None, "C": None}
+
     return {
-        "A": data.get("A") or data.get("va_phase_a"),
-        "B": data.get("B") or data.get("va_phase_b"),
-        "C": data.get("C") or data.get("va_phase_c"),
+        "A": first_value(data, "A", "va_phase_a"),
+        "B": first_value(data, "B", "va_phase_b"),
+        "C": first_value(data, "C", "va_phase_c"),
     }
 
 
@@ -69,11 +105,8 @@ def _panel_side_is_empty(side: Optional[Dict[str, Any]]) -> bool:
     if not isinstance(side, dict):
         return True
 
-    if _has_panel_value(side.get("circuit_number")):
-        return False
-
-    for key in ("load_name", "load_classification", "trip", "poles"):
-        if _has_panel_value(side.get(key)):
+    for value in map(side.get, _SIDE_VALUE_KEYS):
+        if _has_panel_value(value):
             return False
 
     phase_loads = side.get("phase_loads") or {}
@@ -95,29 +128,38 @@ def _panel_entry_to_side(entry: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-def normalize_panel_side_data(data: Dict[str, Any]) -> Dict[str, Any]:
-    """Normalize a single side (left/right) of a panel schedule row."""
-    if not isinstance(data, dict):
-        return {
-            "circuit_number": None,
-            "load_classification": None,
-            "load_name": None,
-            "trip": None,
-            "poles": None,
-            "phase_loads": {"A": None, "B": None, "C": None},
-        }
+def _empty_panel_side() -> Dict[str, Any]:
+    """Return a fresh side dict with every field unset."""
+    return {
+        "circuit_number": None,
+        "load_classification": None,
+        "load_name": None,
+        "trip": None,
+        "poles": None,
+        "phase_loads": {"A": None, "B": None, "C": None},
+    }
+
+
+def normalize_panel_side_data(data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Normalize a single side (left/right) of a panel schedule row.
+    None or any other non-dict value yields an empty side.
+    """
+    if not isinstance(data, dict) or not data:
+        return _empty_panel_side()
 
     circuit_number = extract_panel_circuit_number(data)
-    load_name = data.get("load_name") or data.get("description") or data.get("load")
-    trip = data.get("trip") or data.get("breaker") or data.get("amps")
-    poles = data.get("poles") or data.get("pole") or data.get("phases")
+    load_name = first_value(data, "load_name", "description", "load")
+    trip = first_value(data, "trip", "breaker", "amps")
+    poles = first_value(data, "poles", "pole", "phases")
 
     normalized = {
         "circuit_number": circuit_number,
-        "load_classification": data.get("load_classification")
-        or data.get("classification"),
+        "load_classification": first_value(
+            data, "load_classification", "classification"
+        ),
         "load_name": load_name,
-        "trip": str(trip).strip() if isinstance(trip, str) else trip,
+        "trip": sys.intern(trip.strip()) if isinstance(trip, str) else trip,
         "poles": safe_int(poles) if poles is not None else None,
         "phase_loads": normalize_phase_loads(data),
     }
@@ -128,29 +170,26 @@ def normalize_panels_list_entry(entry: Any, panel_name: str, index: int) -> Dict
     """Normalize entries under ELECTRICAL.panels[].circuits."""
     if not isinstance(entry, dict):
         logger.warning(
-            f"Unexpected panel circuit entry type in panel '{panel_name}' index {index}: {entry}"
+            "Unexpected panel circuit entry type in panel '%s' index %s: %s",
+            panel_name,
+            index,
+            entry,
         )
-        return {
-            "circuit_number": None,
-            "load_classification": None,
-            "load_name": None,
-            "trip": None,
-            "poles": None,
-            "phase_loads": {"A": None, "B": None, "C": None},
-            "right_side": normalize_panel_side_data({}),
-        }
+        normalized = _empty_panel_side()
+        normalized["right_side"] = _empty_panel_side()
+        return normalized
 
     # Case 1: Newer structure with explicit left/right objects
-    if "left" in entry or "right" in entry:
-        left_side = normalize_panel_side_data(entry.get("left") or {})
-        right_side = normalize_panel_side_data(entry.get("right") or {})
+    if not entry.keys().isdisjoint(_LEFT_RIGHT_KEYS):
+        left_side = normalize_panel_side_data(entry.get("left"))
+        right_side = normalize_panel_side_data(entry.get("right"))
 
         # If left side missing but right present, swap to keep numbering intact
         if (
             left_side.get("circuit_number") is None
             and right_side.get("circuit_number") is not None
         ):
-            left_side, right_side = right_side, normalize_panel_side_data({})
+            left_side, right_side = right_side, _empty_panel_side()
 
         normalized = {
             "circuit_number": left_side.get("circuit_number"),
@@ -166,14 +205,13 @@ def normalize_panels_list_entry(entry: Any, panel_name: str, index: int) -> Dict
     # Case 2: Already in expected structure
     normalized = entry.copy()
 
-    if "phase_loads" not in normalized or not isinstance(
-        normalized.get("phase_loads"), dict
-    ):
+    phase_loads = normalized.get("phase_loads")
+    if not isinstance(phase_loads, dict):
         normalized["phase_loads"] = normalize_phase_loads(normalized)
 
     if "right_side" in normalized:
         normalized["right_side"] = normalize_panel_side_data(
-            normalized.get("right_side") or {}
+            normalized.get("right_side")
         )
         if _panel_side_is_empty(normalized["right_side"]):
             normalized.pop("right_side", None)
@@ -184,326 +222,398 @@ def normalize_panels_list_entry(entry: Any, panel_name: str, index: int) -> Dict
     return normalized
 
 
+_CIRCUIT_SYNONYMS: Dict[str, Tuple[str, ...]] = {
+    "circuit": (
+        "circuit_no",
+        "ckt",
+        "circuit_number",
+        "#",
+        "no",
+        "ckt_no",
+        "circuit_num",
+        "cct",
+        "cct_no",
+        "circuit_id",
+        "number",
+        "branch",
+        "branch_no",
+    ),
+    "load_name": (
+        "description",
+        "equipment",
+        "load description",
+        "serves",
+        "item",
+        "connected_to",
+        "load",
+        "device",
+        "designation",
+        "usage",
+        "purpose",
+        "notes",
+        "function",
+        "servicing",
+        "area_served",
+        "room",
+        "location",
+        "powered_device",
+    ),
+    "trip": (
+        "breaker",
+        "amps",
+        "size",
+        "rating",
+        "amp",
+        "ocp",
+        "breaker_size",
+        "amperage",
+        "ampacity",
+        "amp_rating",
+        "trip_size",
+        "breaker_rating",
+        "ocpd",
+        "overcurrent",
+        "amp_trip",
+        "current",
+        "current_rating",
+        "a",
+        "protection",
+    ),
+    "poles": (
+        "pole",
+        "p",
+        "#p",
+        "no_poles",
+        "num_poles",
+        "pole_count",
+        "phases",
+        "phase",
+        "num_phases",
+        "number_of_poles",
+        "number_poles",
+        "ph",
+        "p#",
+        "num_p",
+    ),
+    "va_phase_a": (
+        "va a",
+        "phase a",
+        "ph a",
+        "a va",
+        "va_a",
+        "phase_a",
+        "a_phase",
+        "a_load",
+        "va_phase_1",
+        "phase_1",
+        "ph_a",
+        "va_a_phase",
+        "load_a",
+        "ph1",
+        "phase1",
+        "ph_1",
+        "phase_1_load",
+    ),
+    "va_phase_b": (
+        "va b",
+        "phase b",
+        "ph b",
+        "b va",
+        "va_b",
+        "phase_b",
+        "b_phase",
+        "b_load",
+        "va_phase_2",
+        "phase_2",
+        "ph_b",
+        "va_b_phase",
+        "load_b",
+        "ph2",
+        "phase2",
+        "ph_2",
+        "phase_2_load",
+    ),
+    "va_phase_c": (
+        "va c",
+        "phase c",
+        "ph c",
+        "c va",
+        "va_c",
+        "phase_c",
+        "c_phase",
+        "c_load",
+        "va_phase_3",
+        "phase_3",
+        "ph_c",
+        "va_c_phase",
+        "load_c",
+        "ph3",
+        "phase3",
+        "ph_3",
+        "phase_3_load",
+    ),
+    "total_va": (
+        "va total",
+        "connected va",
+        "kva",
+        "total_kva",
+        "connected_load",
+        "load",
+        "total",
+        "sum",
+        "total_load",
+        "connected",
+        "va_total",
+        "total_connected",
+        "kva_total",
+        "va_sum",
+        "load_total",
+        "demand",
+        "total_demand",
+        "volt_amps",
+    ),
+}
+
+# Synonym -> ((target, priority), ...). "load" is listed under both load_name
+# and total_va, so a synonym may resolve to more than one target.
+_CIRCUIT_SYNONYM_MAP: Dict[str, Tuple[Tuple[str, int], ...]] = {}
+for _target, _synonyms in _CIRCUIT_SYNONYMS.items():
+    for _rank, _synonym in enumerate((_target,) + _synonyms):
+        _CIRCUIT_SYNONYM_MAP[_synonym] = _CIRCUIT_SYNONYM_MAP.get(_synonym, ()) + (
+            (_target, _rank),
+        )
+del _target, _synonyms, _rank, _synonym
+
+
+def _coerce_poles(value: Any) -> Any:
+    """Poles -> int, e.g. "3 P" -> 3."""
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        stripped = value.strip()
+        # Bare pole counts ("1", "2", "3") need no splitting
+        if stripped.isdecimal():
+            return int(stripped)
+        parts = stripped.split(None, 1)
+        return int(parts[0]) if parts else 0
+    return 0
+
+
+@lru_cache(maxsize=VA_CACHE_SIZE)
+def _parse_va(value: str) -> Any:
+    """Parse a VA string, stripping units and separators."""
+    numeric = strip_non_numeric(value)
+    if "." in numeric:
+        return float(numeric)
+    if numeric:
+        return int(numeric)
+    return 0
+
+
+def _coerce_va(value: Any) -> Any:
+    """VA strings -> int/float with units and separators stripped."""
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        # Clean integer loads ("180") skip the scrub and the cache
+        if value.isdecimal():
+            return int(value)
+        return _parse_va(value)
+    return 0
+
+
+def _coerce_text(value: Any) -> str:
+    """Keep as string."""
+    return str(value).strip()
+
+
+def _coerce_label(value: Any) -> str:
+    """
+    Keep as string, interned. Circuit numbers and trip sizes come from a
+    small set ("1".."84", "20", ...) repeated on every panel.
+    """
+    return sys.intern(str(value).strip())
+
+
+_CIRCUIT_COERCERS: Dict[str, Callable[[Any], Any]] = {
+    "circuit": _coerce_label,
+    "load_name": _coerce_text,
+    "trip": _coerce_label,
+    "poles": _coerce_poles,
+    "va_phase_a": _coerce_va,
+    "va_phase_b": _coerce_va,
+    "va_phase_c": _coerce_va,
+    "total_va": _coerce_va,
+}
+
+
+@lru_cache(maxsize=PLAN_CACHE_SIZE)
+def _resolve_circuit_keys(
+    keys: FrozenSet[str],
+) -> Tuple[Tuple[str, str, Callable[[Any], Any]], ...]:
+    """
+    Build the rename plan for a circuit with the given keys.
+
+    Returns (found_key, target_key, coercer) triples. Targets are resolved in
+    declaration order; each takes its canonical key if present, otherwise its
+    highest-priority synonym not claimed by an earlier target. The plan
+    depends only on the key set, so rows sharing a header layout reuse it.
+    """
+    candidates: Dict[str, List[Tuple[int, str]]] = {}
+    for key in keys:
+        for target_key, rank in _CIRCUIT_SYNONYM_MAP.get(key, ()):
+            candidates.setdefault(target_key, []).append((rank, key))
+
+    plan: List[Tuple[str, str, Callable[[Any], Any]]] = []
+    claimed = set()
+    for target_key in _CIRCUIT_SYNONYMS:
+        options = candidates.get(target_key)
+        if not options:
+            continue
+        for _, key in sorted(options):
+            if key not in claimed:
+                claimed.add(key)
+                plan.append((key, target_key, _CIRCUIT_COERCERS[target_key]))
+                break
+    return tuple(plan)
+
+
 def normalize_single_circuit(
-    circuit_data: Dict[str, Any], panel_name: str, index: int
+    circuit_data: Dict[str, Any], panel_name: str, index: int, copy: bool = False
 ) -> Dict[str, Any]:
     """
     Normalizes keys for one circuit dictionary.
     Flexible synonyms for 'circuit', 'trip', 'poles', 'load_name', etc.
+    The dict is updated in place and returned; pass copy=True to leave the
+    input untouched.
     """
     if not isinstance(circuit_data, dict):
         logger.warning(
-            f"Non-dict circuit at index {index} in panel '{panel_name}': {circuit_data}"
+            "Non-dict circuit at index %s in panel '%s': %s",
+            index,
+            panel_name,
+            circuit_data,
         )
         return circuit_data
 
-    normalized = circuit_data.copy()
-
-    # Potential synonyms
-    synonyms_map = {
-        "circuit": [
-            "circuit_no",
-            "ckt",
-            "circuit_number",
-            "#",
-            "no",
-            "ckt_no",
-            "circuit_num",
-            "cct",
-            "cct_no",
-            "circuit_id",
-            "number",
-            "branch",
-            "branch_no",
-        ],
-        "load_name": [
-            "description",
-            "equipment",
-            "load description",
-            "serves",
-            "item",
-            "connected_to",
-            "load",
-            "device",
-            "designation",
-            "usage",
-            "purpose",
-            "notes",
-            "function",
-            "servicing",
-            "area_served",
-            "room",
-            "location",
-            "powered_device",
-        ],
-        "trip": [
-            "breaker",
-            "amps",
-            "size",
-            "rating",
-            "amp",
-            "ocp",
-            "breaker_size",
-            "amperage",
-            "ampacity",
-            "amp_rating",
-            "trip_size",
-            "breaker_rating",
-            "ocpd",
-            "overcurrent",
-            "amp_trip",
-            "current",
-            "current_rating",
-            "a",
-            "protection",
-        ],
-        "poles": [
-            "pole",
-            "p",
-            "#p",
-            "no_poles",
-            "num_poles",
-            "pole_count",
-            "phases",
-            "phase",
-            "num_phases",
-            "number_of_poles",
-            "number_poles",
-            "ph",
-            "p#",
-            "num_p",
-        ],
-        "va_phase_a": [
-            "va a",
-            "phase a",
-            "ph a",
-            "a va",
-            "va_a",
-            "phase_a",
-            "a_phase",
-            "a_load",
-            "va_phase_1",
-            "phase_1",
-            "ph_a",
-            "va_a_phase",
-            "load_a",
-            "ph1",
-            "phase1",
-            "ph_1",
-            "phase_1_load",
-        ],
-        "va_phase_b": [
-            "va b",
-            "phase b",
-            "ph b",
-            "b va",
-            "va_b",
-            "phase_b",
-            "b_phase",
-            "b_load",
-            "va_phase_2",
-            "phase_2",
-            "ph_b",
-            "va_b_phase",
-            "load_b",
-            "ph2",
-            "phase2",
-            "ph_2",
-            "phase_2_load",
-        ],
-        "va_phase_c": [
-            "va c",
-            "phase c",
-            "ph c",
-            "c va",
-            "va_c",
-            "phase_c",
-            "c_phase",
-            "c_load",
-            "va_phase_3",
-            "phase_3",
-            "ph_c",
-            "va_c_phase",
-            "load_c",
-            "ph3",
-            "phase3",
-            "ph_3",
-            "phase_3_load",
-        ],
-        "total_va": [
-            "va total",
-            "connected va",
-            "kva",
-            "total_kva",
-            "connected_load",
-            "load",
-            "total",
-            "sum",
-            "total_load",
-            "connected",
-            "va_total",
-            "total_connected",
-            "kva_total",
-            "va_sum",
-            "load_total",
-            "demand",
-            "total_demand",
-            "volt_amps",
-        ],
-    }
-
-    for target_key, possible_synonyms in synonyms_map.items():
-        found_key = None
-        if target_key in normalized:
-            found_key = target_key
-        else:
-            # Look for synonyms
-            for syn in possible_synonyms:
-                if syn in normalized:
-                    found_key = syn
-                    break
-        if found_key:
-            # Attempt conversions for numeric fields
-            value = normalized[found_key]
-            try:
-                if target_key == "poles":
-                    # Poles -> int
-                    if isinstance(value, (int, float)):
-                        pass
-                    elif isinstance(value, str):
-                        # e.g., "3 P"
-                        parts = value.strip().split()
-                        value = int(parts[0]) if parts else 0
-                    else:
-                        value = 0
-                elif target_key in [
-                    "va_phase_a",
-                    "va_phase_b",
-                    "va_phase_c",
-                    "total_va",
-                ]:
-                    if isinstance(value, (int, float)):
-                        pass
-                    elif isinstance(value, str):
-                        numeric = re.sub(r"[^\d.]", "", value)
-                        if "." in numeric:
-                            value = float(numeric)
-                        elif numeric:
-                            value = int(numeric)
-                        else:
-                            value = 0
-                    else:
-                        value = 0
-                elif target_key in ["circuit", "trip", "load_name"]:
-                    # keep as string
-                    value = str(value).strip()
-            except Exception as e:
-                logger.warning(
-                    f"Normalization error in panel '{panel_name}', circuit index {index}, key '{found_key}': {e}"
-                )
+    normalized = circuit_data.copy() if copy else circuit_data
 
-            # Move the value to the canonical target_key if different
-            if found_key != target_key:
-                del normalized[found_key]
-            normalized[target_key] = value
+    for found_key, target_key, coerce in _resolve_circuit_keys(
+        frozenset(normalized)
+    ):
+        # Attempt conversions for numeric fields
+        value = normalized[found_key]
+        try:
+            value = coerce(value)
+        except Exception as e:
+            logger.warning(
+                "Normalization error in panel '%s', circuit index %s, key '%s': %s",
+                panel_name,
+                index,
+                found_key,
+                e,
+            )
+
+        # Move the value to the canonical target_key if different
+        if found_key != target_key:
+            del normalized[found_key]
+        normalized[target_key] = value
 
     return normalized
 
 
-def validate_panel_structure(electrical: Dict[str, Any]) -> None:
-    """Validate and correct panel schedule structure if needed."""
-    panel_schedules = electrical.get("PANEL_SCHEDULES")
+def _validate_panel_data(panel_data: Dict[str, Any]) -> None:
+    """Ensure one panel object has circuit_details and numbered circuits."""
+    # Ensure circuit_details is present
+    if "circuit_details" not in panel_data:
+        panel_data["circuit_details"] = []
+
+    # Check if circuits have circuit numbers
+    circuits = panel_data.get("circuit_details", [])
+    if circuits and all("circuit" not in ckt for ckt in circuits):
+        # Try to infer circuit numbers
+        for i, ckt in enumerate(circuits):
+            # Add circuit number if missing
+            ckt["circuit"] = str(i + 1)
 
-    # If we have a dict (object), ensure each panel has required properties
-    if isinstance(panel_schedules, dict):
-        for panel_name, panel_data in panel_schedules.items():
-            if isinstance(panel_data, dict):
-                # Ensure circuit_details is present
-                if "circuit_details" not in panel_data:
-                    panel_data["circuit_details"] = []
 
-                # Check if circuits have circuit numbers
-                circuits = panel_data.get("circuit_details", [])
-                if circuits and all("circuit" not in ckt for ckt in circuits):
-                    # Try to infer circuit numbers
-                    for i, ckt in enumerate(circuits):
-                        # Add circuit number if missing
-                        ckt["circuit"] = str(i + 1)
+def _flush_pending(
+    paired: List[Any], pending_left: Optional[Dict[str, Any]]
+) -> None:
+    """Emit a held odd circuit, dropping a right_side that carries no data."""
+    if pending_left:
+        right_side = pending_left.get("right_side")
+        if right_side and _panel_side_is_empty(right_side):
+            pending_left.pop("right_side", None)
+        paired.append(pending_left)
 
 
-def _pair_panel_circuits(circuits: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def _pair_panel_circuits(circuits: Iterable[Any]) -> List[Dict[str, Any]]:
     """
     Pair sequential odd/even circuits so the even entry becomes right_side data.
-    Returns a new list without duplicating even-numbered circuits.
+    Accepts any iterable, so callers can stream freshly normalized circuits
+    in. Returns a new list without duplicating even-numbered circuits.
     """
-    if not isinstance(circuits, list):
-        return circuits
-
     paired: List[Dict[str, Any]] = []
     pending_left: Optional[Dict[str, Any]] = None
 
-    def flush_pending() -> None:
-        nonlocal pending_left
-        if pending_left:
-            right_side = pending_left.get("right_side")
-            if right_side and _panel_side_is_empty(right_side):
-                pending_left.pop("right_side", None)
-            paired.append(pending_left)
-            pending_left = None
-
     for entry in circuits:
         if not isinstance(entry, dict):
-            flush_pending()
+            _flush_pending(paired, pending_left)
+            pending_left = None
             paired.append(entry)
             continue
 
         # Normalize an existing right_side if present
+        has_right_side = False
         if "right_side" in entry:
-            normalized_side = normalize_panel_side_data(entry.get("right_side") or {})
+            normalized_side = normalize_panel_side_data(entry.get("right_side"))
             if _panel_side_is_empty(normalized_side):
                 entry.pop("right_side", None)
             else:
                 entry["right_side"] = normalized_side
+                has_right_side = True
 
         number = safe_int(entry.get("circuit_number"))
-        has_right_side = (
-            "right_side" in entry and not _panel_side_is_empty(entry.get("right_side"))
-        )
 
-        # Already paired entry - keep as-is
-        if has_right_side:
-            flush_pending()
-            paired.append(entry)
-            continue
-
-        if number is None:
-            flush_pending()
+        # Already paired entry, or nothing to pair on - keep as-is
+        if has_right_side or number is None:
+            _flush_pending(paired, pending_left)
+            pending_left = None
             paired.append(entry)
             continue
 
         if number % 2 == 1:
-            flush_pending()
+            _flush_pending(paired, pending_left)
             pending_left = entry
             continue
 
         # Even circuit: try to attach to pending odd
-        if pending_left and safe_int(pending_left.get("circuit_number")) is not None:
-            expected_even = safe_int(pending_left.get("circuit_number")) + 1
-        else:
-            expected_even = None
-
-        if pending_left and expected_even == number:
-            pending_left["right_side"] = _panel_entry_to_side(entry)
-            continue
+        if pending_left:
+            pending_number = safe_int(pending_left.get("circuit_number"))
+            if pending_number is not None and pending_number + 1 == number:
+                pending_left["right_side"] = _panel_entry_to_side(entry)
+                continue
 
         # No matching odd - emit this even as its own row
-        flush_pending()
+        _flush_pending(paired, pending_left)
+        pending_left = None
         paired.append(entry)
 
-    flush_pending()
+    _flush_pending(paired, pending_left)
     return paired
 
 
+def _circuit_sort_key(row: Dict[str, Any]) -> int:
+    """Sort by circuit number, placing unnumbered rows last."""
+    number = row.get("circuit_number")
+    # Rows from normalize_panel_side_data already carry an int
+    if isinstance(number, int):
+        return number
+    parsed = safe_int(number)
+    return parsed if parsed is not None else _UNNUMBERED_SORT_KEY
+
+
 def normalize_panel_fields(parsed_json: Dict[str, Any]) -> Dict[str, Any]:
     """
     If present, navigate to ELECTRICAL -> PANEL_SCHEDULES (object or array).
@@ -520,58 +630,46 @@ def normalize_panel_fields(parsed_json: Dict[str, Any]) -> Dict[str, Any]:
     # Handle both object and array structures for backward compatibility
     panel_schedules = electrical.get("PANEL_SCHEDULES")
 
-    # If panel_schedules is a dict (object), process each panel by name
+    # If panel_schedules is a dict (object), process each panel by name.
+    # Circuits are normalized as they stream into pairing, and each panel is
+    # validated in the same pass rather than walking the schedules again.
     if isinstance(panel_schedules, dict):
         for panel_name, panel_data in panel_schedules.items():
             if isinstance(panel_data, dict):
                 # Ensure circuit_details exists and is a list
                 circuit_details = panel_data.get("circuit_details", [])
                 if isinstance(circuit_details, list):
-                    normalized_circuits = []
-                    for i, ckt in enumerate(circuit_details):
-                        normalized_circuits.append(
-                            normalize_single_circuit(ckt, panel_name, i)
-                        )
                     panel_data["circuit_details"] = _pair_panel_circuits(
-                        normalized_circuits
+                        normalize_single_circuit(ckt, panel_name, i)
+                        for i, ckt in enumerate(circuit_details)
                     )
                 else:
                     logger.warning(
-                        f"Panel '{panel_name}' has a non-list 'circuit_details' field."
+                        "Panel '%s' has a non-list 'circuit_details' field.", panel_name
                     )
+                _validate_panel_data(panel_data)
 
     # Handle legacy array format
     elif isinstance(panel_schedules, list):
-        normalized_schedules = []
         for schedule_obj in panel_schedules:
             if not isinstance(schedule_obj, dict):
-                normalized_schedules.append(schedule_obj)
                 continue
             # Process as before for array format
             panel_data = schedule_obj.get("panel")
             if not isinstance(panel_data, dict):
-                normalized_schedules.append(schedule_obj)
                 continue
 
             panel_name = panel_data.get("name", "UnknownPanel")
             circuits = panel_data.get("circuits", [])
             if isinstance(circuits, list):
-                normalized_circuits = []
-                for i, ckt in enumerate(circuits):
-                    normalized_circuits.append(
-                        normalize_single_circuit(ckt, panel_name, i)
-                    )
-                panel_data["circuits"] = _pair_panel_circuits(normalized_circuits)
+                panel_data["circuits"] = _pair_panel_circuits(
+                    normalize_single_circuit(ckt, panel_name, i)
+                    for i, ckt in enumerate(circuits)
+                )
             else:
                 logger.warning(
-                    f"Panel '{panel_name}' has a non-list 'circuits' field."
+                    "Panel '%s' has a non-list 'circuits' field.", panel_name
                 )
-            normalized_schedules.append(schedule_obj)
-
-        electrical["PANEL_SCHEDULES"] = normalized_schedules
-
-    # Additional validation and correction
-    validate_panel_structure(electrical)
 
     # Also handle ELECTRICAL.panels (alternate structure used elsewhere)
     try:
@@ -583,21 +681,16 @@ def normalize_panel_fields(parsed_json: Dict[str, Any]) -> Dict[str, Any]:
                 circuits = panel.get("circuits")
                 if isinstance(circuits, list):
                     panel_name = panel.get("panel_name", "UnknownPanel")
-                    normalized_circuits = []
-                    for i, entry in enumerate(circuits):
-                        normalized_circuits.append(
-                            normalize_panels_list_entry(entry, panel_name, i)
-                        )
-
-                    def _sort_key(row: Dict[str, Any]) -> int:
-                        num = row.get("circuit_number")
-                        parsed = safe_int(num)
-                        return parsed if parsed is not None else 10**9
-
-                    sorted_circuits = sorted(normalized_circuits, key=_sort_key)
-                    panel["circuits"] = _pair_panel_circuits(sorted_circuits)
+                    # Built aside and assigned only once complete, so a
+                    # failure leaves the panel's original circuits untouched
+                    normalized_circuits = [
+                        normalize_panels_list_entry(entry, panel_name, i)
+                        for i, entry in enumerate(circuits)
+                    ]
+                    normalized_circuits.sort(key=_circuit_sort_key)
+                    panel["circuits"] = _pair_panel_circuits(normalized_circuits)
     except Exception as e:
-        logger.debug(f"Panel list post-processing note: {e}")
+        logger.debug("Panel list post-processing note: %s", e)
 
     return parsed_json
 
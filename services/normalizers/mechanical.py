@@ -3,50 +3,74 @@ Mechanical normalization utilities.
 Handles equipment schedules, air devices, diffusers, and HVAC systems.
 """
 import logging
-from typing import Dict, Any
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, Any, Optional
 
 logger = logging.getLogger(__name__)
 
+# Equipment lists repeat the same type strings and tag prefixes many times
+EQUIPMENT_TYPE_CACHE_SIZE = 1024
+
+# Substrings of the type field, checked in order; first match wins
+_TYPE_SUBSTRINGS = (
+    ("fan", "fans"),
+    ("pump", "pumps"),
+    ("unit", "airHandlingUnits"),
+    ("ahu", "airHandlingUnits"),
+    ("vav", "vavBoxes"),
+    ("chiller", "chillers"),
+    ("boiler", "boilers"),
+)
+
+# Upper-cased tag prefixes (three- and two-character) to categories
+_ID_PREFIX_MAP = {
+    "AHU": "airHandlingUnits",
+    "VAV": "vavBoxes",
+    "FCU": "fanCoilUnits",
+    "EF": "fans",
+    "SF": "fans",
+    "CH": "chillers",
+    "B-": "boilers",
+    "P-": "pumps",
+}
+
+
+@lru_cache(maxsize=EQUIPMENT_TYPE_CACHE_SIZE)
+def _classify_equipment(type_field: Optional[str], id_prefix: Optional[str]) -> str:
+    """Map a type string and upper-cased ID prefix to an equipment category."""
+    if type_field:
+        type_lower = type_field.lower()
+        for needle, category in _TYPE_SUBSTRINGS:
+            if needle in type_lower:
+                return category
+
+    if id_prefix:
+        category = _ID_PREFIX_MAP.get(id_prefix[:3]) or _ID_PREFIX_MAP.get(
+            id_prefix[:2]
+        )
+        if category:
+            return category
+
+    # Default category
+    return "generalEquipment"
+
 
 def get_equipment_type(equipment_item: Dict[str, Any]) -> str:
     """Helper function to determine equipment type from item data."""
     # Check for explicit type field
     type_field = equipment_item.get("type") or equipment_item.get("equipment_type")
-    if type_field and isinstance(type_field, str):
-        if "fan" in type_field.lower():
-            return "fans"
-        elif "pump" in type_field.lower():
-            return "pumps"
-        elif "unit" in type_field.lower() or "ahu" in type_field.lower():
-            return "airHandlingUnits"
-        elif "vav" in type_field.lower():
-            return "vavBoxes"
-        elif "chiller" in type_field.lower():
-            return "chillers"
-        elif "boiler" in type_field.lower():
-            return "boilers"
+    if not isinstance(type_field, str):
+        type_field = None
 
     # Check ID/mark field patterns
     id_field = equipment_item.get("id") or equipment_item.get("mark") or ""
     if isinstance(id_field, str):
         id_prefix = id_field.upper()[:3] if id_field else ""
-        if id_prefix.startswith("AHU"):
-            return "airHandlingUnits"
-        elif id_prefix.startswith("EF") or id_prefix.startswith("SF"):
-            return "fans"
-        elif id_prefix.startswith("VAV"):
-            return "vavBoxes"
-        elif id_prefix.startswith("FCU"):
-            return "fanCoilUnits"
-        elif id_prefix.startswith("CH"):
-            return "chillers"
-        elif id_prefix.startswith("B-"):
-            return "boilers"
-        elif id_prefix.startswith("P-"):
-            return "pumps"
+    else:
+        id_prefix = None
 
-    # Default category
-    return "generalEquipment"
+    return _classify_equipment(type_field, id_prefix)
 
 
 def normalize_mechanical_schedule(parsed_json: Dict[str, Any]) -> Dict[str, Any]:
@@ -70,15 +94,13 @@ def normalize_mechanical_schedule(parsed_json: Dict[str, Any]) -> Dict[str, Any]
         pass
     elif isinstance(equipment, list):
         # Convert flat list to categorized dictionary
-        equipment_by_type = {}
+        equipment_by_type = defaultdict(list)
         for item in equipment:
             if isinstance(item, dict):
                 # Try to determine equipment type
-                equip_type = get_equipment_type(item)
-                if equip_type not in equipment_by_type:
-                    equipment_by_type[equip_type] = []
-                equipment_by_type[equip_type].append(item)
-        mechanical["equipment"] = equipment_by_type
+                equipment_by_type[get_equipment_type(item)].append(item)
+        # Plain dict so the serialized shape is unchanged
+        mechanical["equipment"] = dict(equipment_by_type)
 
     # Handle other mechanical schedules if needed
     # [Add more normalization logic for other mechanical subtypes as needed]
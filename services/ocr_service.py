@@ -3,6 +3,7 @@ Production-ready OCR service with memory-safe tiling and 10% overlap.
 Intelligent trigger logic: per-page text density + file size heuristics → OCR with proven 3x3 @ 600 DPI.
 Features: 10% tile overlap ensures no text loss at boundaries, systematic coverage of entire drawing.
 """
+import asyncio
 import base64
 import logging
 import os
@@ -21,6 +22,10 @@ DPI = int(os.getenv("OCR_DPI", "300"))  # 300 DPI is sufficient for text
 MODEL = os.getenv("OCR_MODEL", "gpt-4o-mini")  # Fast, cheap, accurate enough
 TOKENS_PER_TILE = int(os.getenv("OCR_TOKENS_PER_TILE", "3000"))  # Enough for full page
 OVERLAP_PERCENT = 0.1  # 10% overlap between tiles - proven to prevent text loss at boundaries
+CONCURRENCY = int(os.getenv("OCR_CONCURRENCY", "4"))  # Tiles rendered/in flight at once
+TILE_FORMAT = os.getenv("OCR_TILE_FORMAT", "png").lower()  # "png" (lossless) or "jpeg" (smaller uploads)
+JPEG_QUALITY = int(os.getenv("OCR_JPEG_QUALITY", "85"))  # Only used when OCR_TILE_FORMAT=jpeg
+PER_PAGE_SKIP = int(os.getenv("OCR_PER_PAGE_SKIP", "2500"))  # Skip pages with this much text (0 = never)
 
 
 @dataclass
@@ -68,6 +73,46 @@ def _collect_text_from_content(content: Any) -> str:
     return "\n".join(fragment for fragment in fragments if fragment).strip()
 
 
+def _tile_spans(start: float, end: float) -> list[tuple[float, float]]:
+    """
+    Split one page axis into GRID spans, each extended by OVERLAP_PERCENT of
+    a tile into its neighbours (not past the page edges).
+    """
+    tile_size = (end - start) / GRID
+    overlap = tile_size * OVERLAP_PERCENT
+    spans = []
+    for index in range(GRID):
+        low = start + index * tile_size
+        high = low + tile_size
+        # Leading edge overlaps unless first; trailing edge unless last
+        if index > 0:
+            low -= overlap
+        if index < GRID - 1:
+            high += overlap
+        spans.append((max(low, start), min(high, end)))
+    return spans
+
+
+def _response_text(response: Any) -> str:
+    """Return the text of a Chat Completions response, or "" if it has none."""
+    choices = getattr(response, "choices", None)
+    if not choices:
+        return ""
+    message = getattr(choices[0], "message", None)
+    if not message:
+        return ""
+    return _collect_text_from_content(message.content)
+
+
+def _tile_data_url(tile_pix: Any) -> str:
+    """Encode a rendered tile as a data URL in the configured image format."""
+    if TILE_FORMAT in ("jpeg", "jpg"):
+        img_bytes, mime = tile_pix.tobytes("jpeg", jpg_quality=JPEG_QUALITY), "image/jpeg"
+    else:
+        img_bytes, mime = tile_pix.tobytes("png"), "image/png"
+    return f"data:{mime};base64,{base64.b64encode(img_bytes).decode('ascii')}"
+
+
 def should_perform_ocr(extracted_text: str, pdf_path: str, page_count: int, ocr_enabled: bool = True, ocr_threshold: int = 1500) -> tuple[bool, str]:
     """
     Determine if OCR should be performed based on proven test data thresholds.
@@ -109,6 +154,8 @@ async def ocr_page_with_tiling(
     pdf_path: str,
     page_num: int,
     drawing_type: Optional[str] = None,
+    doc: Optional[Any] = None,
+    skip_text_rich: bool = True,
 ) -> OCRRunResult:
     """
     Memory-safe tiling OCR with 10% overlap between tiles.
@@ -118,134 +165,153 @@ async def ocr_page_with_tiling(
     - Uses PDF coordinates for correct tile boundaries
     - 10% overlap ensures no text is lost at tile boundaries
     - 3x3 grid @ 600 DPI for optimal accuracy on construction drawings
+    - Tiles are OCR'd concurrently, at most OCR_CONCURRENCY at a time
     
     Args:
         client: OpenAI client for API calls
         pdf_path: Path to the PDF file
         page_num: Page number to process (0-indexed)
+        doc: Already-open document for pdf_path; opened here when omitted
+        skip_text_rich: Skip pages with at least OCR_PER_PAGE_SKIP chars of text
     """
-    with fitz.open(pdf_path) as doc:
-        if page_num >= len(doc):
-            return ""
-            
-        page = doc[page_num]
-        
-        # Always proceed with OCR once file-level trigger is met
-        existing_text = page.get_text("text").strip()
-        logger.info(f"Proceeding with OCR for page {page_num + 1} ({len(existing_text)} existing chars)")
-        logger.info(f"Using {GRID}x{GRID} tiling @ {DPI} DPI with {int(OVERLAP_PERCENT * 100)}% overlap")
-        
-        # PDF coordinates (not pixels!)
-        page_rect = page.rect
-        tile_width = page_rect.width / GRID
-        tile_height = page_rect.height / GRID
-        
-        # Calculate overlap amounts
-        overlap_width = tile_width * OVERLAP_PERCENT
-        overlap_height = tile_height * OVERLAP_PERCENT
-        
-        # DPI matrix
-        matrix = fitz.Matrix(DPI / 72, DPI / 72)
-        tracker = get_tracker()
-        ocr_texts = []
-        tiles_processed = 0
+    if doc is None:
+        with fitz.open(pdf_path) as opened:
+            return await ocr_page_with_tiling(
+                client,
+                pdf_path,
+                page_num,
+                drawing_type=drawing_type,
+                doc=opened,
+                skip_text_rich=skip_text_rich,
+            )
+
+    if page_num >= len(doc):
+        return OCRRunResult("", 0)
         
-        for row in range(GRID):
-            for col in range(GRID):
-                try:
-                    tiles_processed += 1
-                    # Calculate base tile position
-                    base_x0 = page_rect.x0 + col * tile_width
-                    base_y0 = page_rect.y0 + row * tile_height
-                    base_x1 = base_x0 + tile_width
-                    base_y1 = base_y0 + tile_height
-                    
-                    # Apply overlap (extend tile boundaries)
-                    # Left edge: add overlap unless it's the leftmost column
-                    x0 = base_x0 - (overlap_width if col > 0 else 0)
-                    # Top edge: add overlap unless it's the topmost row
-                    y0 = base_y0 - (overlap_height if row > 0 else 0)
-                    # Right edge: add overlap unless it's the rightmost column
-                    x1 = base_x1 + (overlap_width if col < GRID - 1 else 0)
-                    # Bottom edge: add overlap unless it's the bottommost row
-                    y1 = base_y1 + (overlap_height if row < GRID - 1 else 0)
-                    
-                    # Ensure we stay within page boundaries
-                    x0 = max(x0, page_rect.x0)
-                    y0 = max(y0, page_rect.y0)
-                    x1 = min(x1, page_rect.x1)
-                    y1 = min(y1, page_rect.y1)
-                    
-                    tile_rect = fitz.Rect(x0, y0, x1, y1)
-                    
-                    # Render ONLY this tile (memory safe!)
-                    tile_pix = page.get_pixmap(matrix=matrix, clip=tile_rect, alpha=False)
-                    img_b64 = base64.b64encode(tile_pix.tobytes("png")).decode()
-                    
-                    # OCR via Chat Completions vision endpoint
-                    tile_start = time.time()
-                    response = await client.chat.completions.create(
-                        model=MODEL,
-                        messages=[
+    page = doc[page_num]
+    
+    # The file-level trigger can fire for mixed sets; vector pages already
+    # carry their text in the extraction result, so skip their tiles
+    existing_text = page.get_text("text").strip()
+    if skip_text_rich and PER_PAGE_SKIP and len(existing_text) >= PER_PAGE_SKIP:
+        logger.info(f"Skipping OCR for page {page_num + 1} ({len(existing_text)} existing chars)")
+        return OCRRunResult("", 0)
+    logger.info(f"Proceeding with OCR for page {page_num + 1} ({len(existing_text)} existing chars)")
+    logger.info(f"Using {GRID}x{GRID} tiling @ {DPI} DPI with {int(OVERLAP_PERCENT * 100)}% overlap")
+    
+    # PDF coordinates (not pixels!); tile edges are shared by every tile in
+    # the same row/column, so compute each axis once
+    page_rect = page.rect
+    x_spans = _tile_spans(page_rect.x0, page_rect.x1)
+    y_spans = _tile_spans(page_rect.y0, page_rect.y1)
+
+    # DPI matrix
+    matrix = fitz.Matrix(DPI / 72, DPI / 72)
+    # Bounds both in-flight requests and rendered tiles held in memory
+    semaphore = asyncio.Semaphore(max(CONCURRENCY, 1))
+    tasks = [
+        _ocr_tile(
+            client,
+            page,
+            matrix,
+            fitz.Rect(x0, y0, x1, y1),
+            semaphore,
+            pdf_path=pdf_path,
+            page_num=page_num,
+            row=row,
+            col=col,
+            drawing_type=drawing_type,
+        )
+        for row, (y0, y1) in enumerate(y_spans)
+        for col, (x0, x1) in enumerate(x_spans)
+    ]
+
+    # Results come back in tile order, so the joined text reads as before
+    tile_texts = await asyncio.gather(*tasks)
+    ocr_texts = [text for text in tile_texts if text]
+
+    if ocr_texts:
+        return OCRRunResult("\n\n".join(ocr_texts), len(tasks))
+    return OCRRunResult("", len(tasks))
+
+
+async def _ocr_tile(
+    client: AsyncOpenAI,
+    page: Any,
+    matrix: Any,
+    tile_rect: Any,
+    semaphore: asyncio.Semaphore,
+    *,
+    pdf_path: str,
+    page_num: int,
+    row: int,
+    col: int,
+    drawing_type: Optional[str] = None,
+) -> str:
+    """OCR one tile of a page, returning its text ("" on failure)."""
+    async with semaphore:
+        try:
+            # Render ONLY this tile (memory safe!)
+            tile_pix = page.get_pixmap(matrix=matrix, clip=tile_rect, alpha=False)
+            image_url = _tile_data_url(tile_pix)
+            del tile_pix
+
+            # OCR via Chat Completions vision endpoint
+            tile_start = time.time()
+            response = await client.chat.completions.create(
+                model=MODEL,
+                messages=[
+                    {
+                        "role": "user",
+                        "content": [
+                            {
+                                "type": "text",
+                                "text": "Extract ALL text from this construction drawing section:",
+                            },
                             {
-                                "role": "user",
-                                "content": [
-                                    {
-                                        "type": "text",
-                                        "text": "Extract ALL text from this construction drawing section:",
-                                    },
-                                    {
-                                        "type": "image_url",
-                                        "image_url": {"url": f"data:image/png;base64,{img_b64}"},
-                                    },
-                                ],
-                            }
+                                "type": "image_url",
+                                "image_url": {"url": image_url},
+                            },
                         ],
-                        max_tokens=TOKENS_PER_TILE,
-                    )
-                    request_duration = time.time() - tile_start
-                    usage = getattr(response, "usage", None)
-                    prompt_tokens = getattr(usage, "prompt_tokens", 0) or 0
-                    completion_tokens = getattr(usage, "completion_tokens", 0) or 0
-                    total_tokens = getattr(usage, "total_tokens", 0) or 0
-                    
-                    try:
-                        tracker.add_metric_with_context(
-                            category="api_request",
-                            duration=request_duration,
-                            file_path=pdf_path,
-                            drawing_type=drawing_type or "OCR",
-                            model=MODEL,
-                            api_type="ocr_tile",
-                            prompt_tokens=prompt_tokens,
-                            completion_tokens=completion_tokens,
-                            total_tokens=total_tokens,
-                            tokens_per_second=(
-                                completion_tokens / request_duration
-                                if request_duration > 0 and completion_tokens
-                                else None
-                            ),
-                            ocr_page=page_num + 1,
-                            ocr_tile=f"{row}-{col}",
-                            ocr_grid=GRID,
-                            is_ocr=True,
-                        )
-                    except Exception as metric_err:
-                        logger.debug(f"OCR metric logging failed: {metric_err}")
-
-                    choice = (getattr(response, "choices", None) or [None])[0]
-                    text = ""
-                    if choice and getattr(choice, "message", None):
-                        text = _collect_text_from_content(choice.message.content)
-                    if text and text.strip():
-                        ocr_texts.append(text.strip())
-                        
-                except Exception as e:
-                    logger.warning(f"Tile {row},{col} failed: {e}")
-        
-        if ocr_texts:
-            return OCRRunResult("\n\n".join(ocr_texts), tiles_processed)
-        return OCRRunResult("", tiles_processed)
+                    }
+                ],
+                max_tokens=TOKENS_PER_TILE,
+            )
+            request_duration = time.time() - tile_start
+            usage = getattr(response, "usage", None)
+            prompt_tokens = getattr(usage, "prompt_tokens", 0) or 0
+            completion_tokens = getattr(usage, "completion_tokens", 0) or 0
+            total_tokens = getattr(usage, "total_tokens", 0) or 0
+
+            try:
+                get_tracker().add_metric_with_context(
+                    category="api_request",
+                    duration=request_duration,
+                    file_path=pdf_path,
+                    drawing_type=drawing_type or "OCR",
+                    model=MODEL,
+                    api_type="ocr_tile",
+                    prompt_tokens=prompt_tokens,
+                    completion_tokens=completion_tokens,
+                    total_tokens=total_tokens,
+                    tokens_per_second=(
+                        completion_tokens / request_duration
+                        if request_duration > 0 and completion_tokens
+                        else None
+                    ),
+                    ocr_page=page_num + 1,
+                    ocr_tile=f"{row}-{col}",
+                    ocr_grid=GRID,
+                    is_ocr=True,
+                )
+            except Exception as metric_err:
+                logger.debug(f"OCR metric logging failed: {metric_err}")
+
+            return _response_text(response)
+
+        except Exception as e:
+            logger.warning(f"Tile {row},{col} failed: {e}")
+            return ""
 
 
 async def run_ocr_if_needed(
@@ -257,6 +323,7 @@ async def run_ocr_if_needed(
     page_count: int | None = None,
     assume_ocr_needed: bool | None = None,
     drawing_type: Optional[str] = None,
+    skip_text_rich_pages: bool = True,
 ) -> OCRRunResult:
     """
     Intelligent OCR decision based on text density and file characteristics.
@@ -268,18 +335,22 @@ async def run_ocr_if_needed(
         current_text: Text already extracted by PyMuPDF
         threshold: Characters per page threshold (not total characters)
         max_pages: Maximum pages to OCR for cost control
+        skip_text_rich_pages: Skip pages that already have OCR_PER_PAGE_SKIP chars;
+            pass False when OCR is forced regardless of existing text
         
     Returns:
         OCRRunResult containing text (if any) and tile metadata
     """
-    # Determine page_count once if not provided
+    # Determine page_count once if not provided; the open document is kept
+    # for the OCR pass below so the PDF is only parsed once
+    doc = None
     if page_count is None:
         try:
-            with fitz.open(pdf_path) as doc:
-                page_count = len(doc)
+            doc = fitz.open(pdf_path)
         except Exception as e:
             logger.warning(f"Could not read PDF for OCR decision: {e}")
             return ""
+        page_count = len(doc)
 
     # Honor prior OCR decision when provided by caller
     if assume_ocr_needed is not None:
@@ -296,6 +367,8 @@ async def run_ocr_if_needed(
     
     if not should_ocr:
         logger.info(f"OCR SKIPPED: {reason}")
+        if doc is not None:
+            doc.close()
         return OCRRunResult("", 0)
     
     logger.info(f"🎯 OCR TRIGGERED: {reason}")
@@ -303,23 +376,33 @@ async def run_ocr_if_needed(
     ocr_results = []
     tiles_processed_total = 0
     
-    # OCR up to max_pages
-    pages_to_ocr = min(max_pages, page_count)
-    for page_num in range(pages_to_ocr):
+    if doc is None:
         try:
-            page_result = await ocr_page_with_tiling(
-                client,
-                pdf_path,
-                page_num,
-                drawing_type=drawing_type,
-            )
-            tiles_processed_total += page_result.tiles_processed
-            if page_result.text:
-                ocr_results.append(f"[OCR Page {page_num + 1}]:\n{page_result.text}")
-                logger.info(f"✅ OCR Page {page_num + 1}: Extracted {len(page_result.text)} characters")
+            doc = fitz.open(pdf_path)
         except Exception as e:
-            logger.warning(f"❌ OCR failed for page {page_num + 1}: {e}")
-            # Continue with other pages
+            logger.warning(f"❌ OCR failed to open PDF: {e}")
+            return OCRRunResult("", 0)
+
+    # OCR up to max_pages, parsing the PDF once for all of them
+    with doc:
+        pages_to_ocr = min(max_pages, page_count)
+        for page_num in range(pages_to_ocr):
+            try:
+                page_result = await ocr_page_with_tiling(
+                    client,
+                    pdf_path,
+                    page_num,
+                    drawing_type=drawing_type,
+                    doc=doc,
+                    skip_text_rich=skip_text_rich_pages,
+                )
+                tiles_processed_total += page_result.tiles_processed
+                if page_result.text:
+                    ocr_results.append(f"[OCR Page {page_num + 1}]:\n{page_result.text}")
+                    logger.info(f"✅ OCR Page {page_num + 1}: Extracted {len(page_result.text)} characters")
+            except Exception as e:
+                logger.warning(f"❌ OCR failed for page {page_num + 1}: {e}")
+                # Continue with other pages
     
     if ocr_results:
         total_ocr_chars = sum(len(result) for result in ocr_results)
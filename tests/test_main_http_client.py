@@ -0,0 +1,41 @@
+import importlib
+import logging
+import sys
+
+import pytest
+from openai import DefaultAsyncHttpxClient
+
+
+@pytest.fixture
+def main_module(monkeypatch):
+    # config.settings refuses to import without a key
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    return importlib.import_module("main")
+
+
+def test_http2_disabled_uses_sdk_default(main_module, monkeypatch):
+    monkeypatch.setattr(main_module, "OPENAI_HTTP2", False)
+
+    assert main_module.create_http_client() is None
+
+
+@pytest.mark.asyncio
+async def test_http2_enabled_builds_http2_client(main_module, monkeypatch):
+    pytest.importorskip("h2")
+    monkeypatch.setattr(main_module, "OPENAI_HTTP2", True)
+
+    client = main_module.create_http_client()
+    try:
+        assert isinstance(client, DefaultAsyncHttpxClient)
+    finally:
+        await client.aclose()
+
+
+def test_http2_enabled_without_h2_falls_back(main_module, monkeypatch, caplog):
+    monkeypatch.setattr(main_module, "OPENAI_HTTP2", True)
+    # A None entry makes "import h2" raise ImportError
+    monkeypatch.setitem(sys.modules, "h2", None)
+
+    with caplog.at_level(logging.WARNING):
+        assert main_module.create_http_client() is None
+    assert "h2 package is not installed" in caplog.text
@@ -1,6 +1,10 @@
 import copy
 
-from services.normalizers import normalize_panel_fields
+from services.normalizers import electrical, normalize_panel_fields
+from services.normalizers.electrical import (
+    normalize_phase_loads,
+    normalize_single_circuit,
+)
 
 
 def _panel_with_circuits(circuits):
@@ -56,3 +60,47 @@ def test_normalize_preserves_unpaired_even():
     assert circuits[0]["circuit_number"] == 2
     assert "right_side" not in circuits[0]
 
+
+def test_normalize_failure_leaves_panel_circuits_untouched(monkeypatch):
+    # Rows without phase_loads, which normalization would add
+    original = [
+        {"circuit_number": 3, "load_name": "Left 3"},
+        {"circuit_number": 1, "load_name": "Left 1"},
+        {"circuit_number": 2, "load_name": "Right 2"},
+    ]
+    parsed = _panel_with_circuits(original)
+    real_entry = electrical.normalize_panels_list_entry
+
+    def failing_entry(entry, panel_name, index):
+        if index == 2:
+            raise RuntimeError("boom")
+        return real_entry(entry, panel_name, index)
+
+    monkeypatch.setattr(electrical, "normalize_panels_list_entry", failing_entry)
+
+    result = normalize_panel_fields(parsed)
+
+    assert result["ELECTRICAL"]["panels"][0]["circuits"] == original
+
+
+def test_normalize_single_circuit_in_place_unless_copy():
+    raw = {"ckt": " 3 ", "breaker": "20A", "pole": "2 P", "kva": "1,200 VA"}
+
+    copied = normalize_single_circuit(raw, "K1", 0, copy=True)
+    assert raw == {"ckt": " 3 ", "breaker": "20A", "pole": "2 P", "kva": "1,200 VA"}
+    assert copied == {"circuit": "3", "trip": "20A", "poles": 2, "total_va": 1200}
+
+    result = normalize_single_circuit(raw, "K1", 0)
+    assert result is raw
+    assert result == copied
+
+
+def test_normalize_phase_loads_never_returns_the_input_dict():
+    phase_loads = {"A": 100, "B": None, "C": 50}
+    row = {"phase_loads": phase_loads}
+
+    result = normalize_phase_loads(row)
+    result["A"] = 0
+
+    assert result is not phase_loads
+    assert phase_loads == {"A": 100, "B": None, "C": 50}
@@ -0,0 +1,44 @@
+import copy
+
+from services.normalizers import normalize_plumbing_schedule
+from services.normalizers.plumbing import extract_pipe_size
+
+
+def test_extract_pipe_size_prefers_longest_fraction():
+    assert extract_pipe_size('1-1/2"') == 1.5
+    assert extract_pipe_size("3/4 inch") == 0.75
+    assert extract_pipe_size('2-1/2" CW') == 2.5
+    assert extract_pipe_size("4 in") == 4.0
+    assert extract_pipe_size("N/A") == "N/A"
+
+
+def test_normalize_plumbing_schedule_renames_synonyms():
+    parsed = {
+        "PLUMBING": {
+            "fixtures": [{"Mark": "WC-1", "flow_rate": "1.6 GPF"}],
+            "waterHeaters": [{"tag": "WH-1", "capacity": "50 gal"}],
+            "piping": [{"pipe_size": '1-1/2"'}],
+        }
+    }
+
+    plumbing = normalize_plumbing_schedule(parsed)["PLUMBING"]
+
+    assert plumbing["fixtures"] == [{"fixture_id": "WC-1", "flow_rate": 1.6}]
+    assert plumbing["water_heaters"] == [{"heater_id": "WH-1", "capacity": 50.0}]
+    assert plumbing["piping"] == [{"size": 1.5}]
+
+
+def test_normalize_plumbing_schedule_leaves_input_entries_untouched():
+    fixtures = [{"Mark": "WC-1", "flow_rate": "1.6 GPF"}, "note"]
+    heaters = [{"tag": "WH-1", "capacity": "50 gal"}]
+    piping = [{"pipe_size": '1-1/2"'}]
+    originals = copy.deepcopy((fixtures, heaters, piping))
+    parsed = {
+        "PLUMBING": {"fixtures": fixtures, "water_heaters": heaters, "piping": piping}
+    }
+
+    plumbing = normalize_plumbing_schedule(parsed)["PLUMBING"]
+
+    assert (fixtures, heaters, piping) == originals
+    assert plumbing["fixtures"] is not fixtures
+    assert plumbing["fixtures"][1] == "note"
@@ -0,0 +1,38 @@
+from services.normalizers.common import (
+    first_value,
+    invert_synonyms,
+    make_key_remapper,
+    safe_int,
+)
+
+
+def test_safe_int_handles_common_inputs():
+    assert safe_int(7) == 7
+    assert safe_int(" 12 ") == 12
+    assert safe_int("CKT 3") == 3
+    assert safe_int(2.9) == 2
+    assert safe_int(float("nan")) is None
+    assert safe_int("") is None
+    assert safe_int(True) == 1
+
+
+def test_safe_int_returns_none_for_oversized_digit_runs():
+    # Longer than the interpreter's int string-conversion limit
+    assert safe_int("CKT " + "1" * 5000) is None
+    assert safe_int("1" * 5000) is None
+
+
+def test_first_value_matches_or_chain():
+    data = {"A": 0, "va_phase_a": "", "B": None, "va_phase_b": 120}
+
+    assert first_value(data, "A", "va_phase_a") == ""
+    assert first_value(data, "B", "va_phase_b") == 120
+    assert first_value(data, "C", "va_phase_c") is None
+
+
+def test_key_remapper_prefers_synonyms_and_caches_plans():
+    remap = make_key_remapper(invert_synonyms({"size": ["size", "pipe_size", "dia"]}))
+
+    assert remap({"size": 1, "Pipe_Size": 2, "extra": 3}) == {"size": 2, "extra": 3}
+    assert remap({"dia": 4, "pipe_size": 5}) == {"size": 5}
+    assert remap({"size": 6}) == {"size": 6}
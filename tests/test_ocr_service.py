@@ -0,0 +1,227 @@
+import asyncio
+import base64
+from types import SimpleNamespace
+
+import pymupdf as fitz
+import pytest
+
+from services import ocr_service
+from services.ocr_service import (
+    OVERLAP_PERCENT,
+    _tile_data_url,
+    _tile_spans,
+    ocr_page_with_tiling,
+    run_ocr_if_needed,
+)
+
+# Offset page rect, as on PDFs whose mediabox does not start at 0
+PAGE_START, PAGE_END = 36.0, 828.0
+
+
+def test_tile_spans_single_grid_is_full_span(monkeypatch):
+    monkeypatch.setattr(ocr_service, "GRID", 1)
+
+    assert _tile_spans(PAGE_START, PAGE_END) == [(PAGE_START, PAGE_END)]
+
+
+@pytest.mark.parametrize("grid", [2, 3, 4])
+def test_tile_spans_overlap_interior_edges_by_overlap_percent(monkeypatch, grid):
+    monkeypatch.setattr(ocr_service, "GRID", grid)
+    tile_size = (PAGE_END - PAGE_START) / grid
+    overlap = tile_size * OVERLAP_PERCENT
+
+    spans = _tile_spans(PAGE_START, PAGE_END)
+
+    assert len(spans) == grid
+    for index in range(1, grid):
+        boundary = PAGE_START + index * tile_size
+        assert spans[index - 1][1] == pytest.approx(boundary + overlap)
+        assert spans[index][0] == pytest.approx(boundary - overlap)
+
+
+@pytest.mark.parametrize("grid", [1, 2, 3, 4])
+def test_tile_spans_are_clamped_to_page_edges(monkeypatch, grid):
+    monkeypatch.setattr(ocr_service, "GRID", grid)
+
+    spans = _tile_spans(PAGE_START, PAGE_END)
+
+    assert spans[0][0] == PAGE_START
+    assert spans[-1][1] == PAGE_END
+    assert all(PAGE_START <= low < high <= PAGE_END for low, high in spans)
+
+
+@pytest.fixture
+def tile_pixmap():
+    doc = fitz.open()
+    page = doc.new_page(width=200, height=100)
+    page.insert_text((20, 50), "CKT 12 20A 1P")
+    yield page.get_pixmap(matrix=fitz.Matrix(2, 2), alpha=False)
+    doc.close()
+
+
+def _decode_data_url(url):
+    header, payload = url.split(",", 1)
+    return header, base64.b64decode(payload)
+
+
+def test_tile_data_url_defaults_to_lossless_png(tile_pixmap):
+    assert ocr_service.TILE_FORMAT == "png"
+
+    header, image = _decode_data_url(_tile_data_url(tile_pixmap))
+
+    assert header == "data:image/png;base64"
+    assert image.startswith(b"\x89PNG")
+    assert fitz.Pixmap(image).samples == tile_pixmap.samples
+
+
+@pytest.mark.parametrize("tile_format", ["jpeg", "jpg"])
+def test_tile_data_url_encodes_jpeg_when_opted_in(tile_pixmap, monkeypatch, tile_format):
+    monkeypatch.setattr(ocr_service, "TILE_FORMAT", tile_format)
+
+    header, image = _decode_data_url(_tile_data_url(tile_pixmap))
+
+    assert header == "data:image/jpeg;base64"
+    assert image.startswith(b"\xff\xd8")
+    decoded = fitz.Pixmap(image)
+    assert (decoded.width, decoded.height) == (tile_pixmap.width, tile_pixmap.height)
+
+
+class _StubCompletions:
+    """Chat Completions stand-in that echoes each tile's image URL."""
+
+    def __init__(self, fail_url=None):
+        self.fail_url = fail_url
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.calls = 0
+
+    async def create(self, **kwargs):
+        url = kwargs["messages"][0]["content"][1]["image_url"]["url"]
+        self.calls += 1
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            # Earlier tiles finish later, so completion order is reversed
+            await asyncio.sleep(0.01 * (10 - self.calls))
+            if url == self.fail_url:
+                raise RuntimeError("tile request failed")
+            message = SimpleNamespace(content=url)
+            return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=None)
+        finally:
+            self.in_flight -= 1
+
+
+def _stub_client(fail_url=None):
+    return SimpleNamespace(chat=SimpleNamespace(completions=_StubCompletions(fail_url)))
+
+
+@pytest.fixture
+def tile_setup(monkeypatch):
+    """3x3 grid at 72 DPI, two tiles in flight, tiles named by their origin."""
+    monkeypatch.setattr(ocr_service, "GRID", 3)
+    monkeypatch.setattr(ocr_service, "DPI", 72)
+    monkeypatch.setattr(ocr_service, "CONCURRENCY", 2)
+    monkeypatch.setattr(ocr_service, "_tile_data_url", lambda pix: f"tile:{pix.x},{pix.y}")
+
+    doc = fitz.open()
+    page = doc.new_page(width=300, height=300)
+    x_spans = _tile_spans(page.rect.x0, page.rect.x1)
+    y_spans = _tile_spans(page.rect.y0, page.rect.y1)
+    row_major = [f"tile:{int(x0)},{int(y0)}" for y0, _ in y_spans for x0, _ in x_spans]
+    yield doc, row_major
+    doc.close()
+
+
+@pytest.mark.asyncio
+async def test_tiles_bounded_by_concurrency_and_joined_in_row_major_order(tile_setup):
+    doc, row_major = tile_setup
+    client = _stub_client()
+
+    result = await ocr_page_with_tiling(client, "in-memory.pdf", 0, doc=doc)
+
+    completions = client.chat.completions
+    assert completions.calls == 9
+    assert 1 < completions.peak_in_flight <= ocr_service.CONCURRENCY
+    assert result.tiles_processed == 9
+    assert result.text == "\n\n".join(row_major)
+
+
+@pytest.mark.asyncio
+async def test_failing_tile_is_dropped_without_failing_the_page(tile_setup):
+    doc, row_major = tile_setup
+    client = _stub_client(fail_url=row_major[4])
+
+    result = await ocr_page_with_tiling(client, "in-memory.pdf", 0, doc=doc)
+
+    assert result.tiles_processed == 9
+    assert result.text == "\n\n".join(row_major[:4] + row_major[5:])
+
+
+@pytest.fixture
+def mixed_pdf(tmp_path, monkeypatch):
+    """Two-page PDF: a sparse (scanned-like) page, then a text-rich page."""
+    monkeypatch.setattr(ocr_service, "GRID", 1)
+    monkeypatch.setattr(ocr_service, "DPI", 72)
+    monkeypatch.setattr(ocr_service, "PER_PAGE_SKIP", 500)
+
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), "E-101")
+    rich_page = doc.new_page()
+    for line in range(20):
+        rich_page.insert_text((36, 40 + line * 14), f"CKT {line} LIGHTING 20A 1P 1200 VA " * 2)
+    pdf_path = tmp_path / "mixed.pdf"
+    doc.save(pdf_path)
+    doc.close()
+    return str(pdf_path)
+
+
+@pytest.mark.asyncio
+async def test_text_rich_pages_skipped_by_default(mixed_pdf):
+    client = _stub_client()
+
+    result = await run_ocr_if_needed(
+        client, mixed_pdf, "", max_pages=2, assume_ocr_needed=True
+    )
+
+    assert result.tiles_processed == 1
+    assert "[OCR Page 1]" in result.text
+    assert "[OCR Page 2]" not in result.text
+
+
+@pytest.mark.asyncio
+async def test_text_rich_pages_ocrd_when_skip_disabled(mixed_pdf):
+    client = _stub_client()
+
+    result = await run_ocr_if_needed(
+        client,
+        mixed_pdf,
+        "",
+        max_pages=2,
+        assume_ocr_needed=True,
+        skip_text_rich_pages=False,
+    )
+
+    assert result.tiles_processed == 2
+    assert "[OCR Page 1]" in result.text
+    assert "[OCR Page 2]" in result.text
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("assume_ocr_needed", [True, False])
+async def test_pdf_opened_once_when_page_count_unknown(mixed_pdf, monkeypatch, assume_ocr_needed):
+    opened = []
+    real_open = fitz.open
+
+    def counting_open(*args, **kwargs):
+        doc = real_open(*args, **kwargs)
+        opened.append(doc)
+        return doc
+
+    monkeypatch.setattr(ocr_service.fitz, "open", counting_open)
+
+    await run_ocr_if_needed(
+        _stub_client(), mixed_pdf, "", max_pages=2, assume_ocr_needed=assume_ocr_needed
+    )
+
+    assert len(opened) == 1
+    assert opened[0].is_closed
@@ -172,6 +172,30 @@ async def test_plumbing_extractor_error_handling():
         extractor.__class__.__bases__[0].extract = original_extract
 
 
+@pytest.mark.asyncio
+async def test_plumbing_extractor_skips_enhancement_for_short_text():
+    """Short pages without tables are returned without enhancement markers."""
+    extractor = PlumbingExtractor(logger)
+    original_extract = extractor.__class__.__bases__[0].extract
+
+    async def mock_extract(*args, **kwargs):
+        from services.extraction_service import ExtractionResult
+
+        return ExtractionResult(
+            raw_text="Legend: fixture symbols", tables=[], success=True, has_content=True
+        )
+
+    try:
+        extractor.__class__.__bases__[0].extract = mock_extract
+
+        result = await extractor.extract("legend.pdf")
+
+        assert result.raw_text == "Legend: fixture symbols"
+        assert "PLUMBING CONTENT:" not in result.raw_text
+    finally:
+        extractor.__class__.__bases__[0].extract = original_extract
+
+
 @pytest.mark.asyncio
 async def test_prioritize_plumbing_tables():
     """Test the table prioritization logic."""
@@ -110,6 +110,23 @@ def test_is_summary_line():
     assert not is_summary_line("Panel: K1")
 
 
+@pytest.mark.parametrize(
+    "line, expected",
+    [
+        ("Receptacle 20 A 180 VA", (True, False)),
+        ("Total Connected Load: 82353 VA", (False, True)),
+        ("Panel: K1", (False, False)),
+    ],
+)
+def test_line_classifiers_are_stable_across_repeats_and_case(line, expected):
+    """Repeated and re-cased lines classify the same as the first call."""
+    is_circuit_row.cache_clear()
+    is_summary_line.cache_clear()
+
+    for variant in (line, line, line.upper(), line.lower(), line):
+        assert (is_circuit_row(variant), is_summary_line(variant)) == expected
+
+
 def test_detect_circuits_per_line_one():
     """Test detection of 1 circuit per line."""
     lines = [